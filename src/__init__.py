@@ -0,0 +1 @@
+# Weather Predict Model - pipeline package
@@ -2,6 +2,27 @@ import pandas as pd
 import numpy as np
 
 
+def _compute_outlier_mask(values):
+    """
+    Compute a mask of values inside the IQR bounds.
+    
+    Args:
+        values: numpy array of column values
+        
+    Returns:
+        numpy array: Boolean mask, True for values to keep
+    """
+    # Calculate Q1, Q3, and IQR (ignoring missing values)
+    Q1, Q3 = np.nanquantile(values, [0.25, 0.75])
+    IQR = Q3 - Q1
+    
+    # Define outlier bounds
+    lower_bound = Q1 - 1.5 * IQR
+    upper_bound = Q3 + 1.5 * IQR
+    
+    return (values >= lower_bound) & (values <= upper_bound)
+
+
 def remove_outliers(df, column, method='iqr'):
     """
     Remove outliers from a column using IQR method.
@@ -17,17 +38,9 @@ def remove_outliers(df, column, method='iqr'):
     if column not in df.columns:
         return df
     
-    # Calculate Q1, Q3, and IQR
-    Q1 = df[column].quantile(0.25)
-    Q3 = df[column].quantile(0.75)
-    IQR = Q3 - Q1
-    
-    # Define outlier bounds
-    lower_bound = Q1 - 1.5 * IQR
-    upper_bound = Q3 + 1.5 * IQR
-    
     # Filter out outliers
-    df_clean = df[(df[column] >= lower_bound) & (df[column] <= upper_bound)]
+    mask = _compute_outlier_mask(df[column].to_numpy(dtype=np.float64, na_value=np.nan))
+    df_clean = df.iloc[np.flatnonzero(mask)]
     
     return df_clean
 
@@ -43,18 +56,17 @@ def fill_missing_values(df, method='forward'):
     Returns:
         pandas DataFrame: DataFrame with filled values
     """
-    df_filled = df.copy()
+    df_filled = df
     
     if method == 'forward':
         # Forward fill (use last valid observation)
         df_filled = df_filled.ffill()
-        # Backward fill for any remaining NaN at start
-        df_filled = df_filled.bfill()
+        # Backward fill only if NaN remain at start (the only place left after ffill)
+        if len(df_filled) > 0 and df_filled.iloc[0].isna().any():
+            df_filled = df_filled.bfill()
     elif method == 'mean':
-        # Fill with column mean
-        numeric_cols = df_filled.select_dtypes(include=[np.number]).columns
-        for col in numeric_cols:
-            df_filled[col].fillna(df_filled[col].mean(), inplace=True)
+        # Fill all numeric columns with their mean in one call
+        df_filled = df_filled.fillna(df_filled.mean(numeric_only=True))
     
     return df_filled
 
@@ -71,10 +83,14 @@ def clean_data(df):
     """
     initial_rows = len(df)
     
-    # Remove outliers from numerical columns
-    df_clean = remove_outliers(df, 'temperature')
-    df_clean = remove_outliers(df_clean, 'humidity')
-    df_clean = remove_outliers(df_clean, 'pressure')
+    # Remove outliers from numerical columns with a single combined mask
+    mask = np.ones(initial_rows, dtype=bool)
+    for column in ['temperature', 'humidity', 'pressure']:
+        if column in df.columns:
+            values = df[column].to_numpy(dtype=np.float64, na_value=np.nan)
+            mask &= _compute_outlier_mask(values)
+    
+    df_clean = df.iloc[np.flatnonzero(mask)]
     
     rows_after_outliers = len(df_clean)
     rows_removed = initial_rows - rows_after_outliers
@@ -1,15 +1,16 @@
 import pandas as pd
 from pathlib import Path
 from datetime import datetime
-import sys
-sys.path.append(str(Path(__file__).parent.parent))
 
 from .validator import load_schema, validate_dataframe
 from .cleaner import clean_data
-from ingest.logger import create_metadata, save_metadata, log_info
+from ..ingest.logger import create_metadata, save_metadata, log_info, PARQUET_WRITE_OPTIONS
 
+# Copy-on-write: derived frames share data until modified
+pd.options.mode.copy_on_write = True
 
-def clean_weather_data(input_path, output_dir, station_id='STATION_001'):
+
+def clean_weather_data(input_path, output_dir, station_id='STATION_001', run_ts=None):
     """
     Clean weather data from parquet format.
     
@@ -17,14 +18,20 @@ def clean_weather_data(input_path, output_dir, station_id='STATION_001'):
         input_path: Path to input parquet file
         output_dir: Directory to save cleaned data
         station_id: Weather station identifier
+        run_ts: Run timestamp for output naming and metadata (default: now)
         
     Returns:
         tuple: (success: bool, output_path: str or None)
     """
+    # Capture the run timestamp once for output paths and metadata
+    if run_ts is None:
+        run_ts = datetime.now()
+    
     log_info(f"Starting cleaning from {input_path}")
     
-    # Read parquet file
-    df = pd.read_parquet(input_path)
+    # Read parquet file in full: optional schema columns may be missing, and extra
+    # columns pass through on purpose, since training uses every non-identifier column
+    df = pd.read_parquet(input_path, engine='pyarrow', dtype_backend='pyarrow')
     log_info(f"Read {len(df)} rows from input")
     
     # Clean the data
@@ -44,19 +51,19 @@ def clean_weather_data(input_path, output_dir, station_id='STATION_001'):
     log_info("Validation passed")
     
     # Create output path with date
-    date_str = datetime.now().strftime('%Y%m%d')
+    date_str = run_ts.strftime('%Y%m%d')
     output_path = Path(output_dir) / f'weather_cleaned_{date_str}.parquet'
     
     # Save as parquet format
-    df_clean.to_parquet(output_path, index=False)
+    df_clean.to_parquet(output_path, **PARQUET_WRITE_OPTIONS)
     log_info(f"Saved cleaned data to {output_path}")
     
     # Create and save metadata
-    metadata = create_metadata(df_clean, station_id, str(output_path))
+    metadata = create_metadata(df_clean, station_id, str(output_path), run_ts=run_ts)
     # Add cleaning stats to metadata
     metadata['rows_removed'] = stats['rows_removed']
     metadata['missing_values_filled'] = stats['missing_values_filled']
-    metadata['cleaning_date'] = datetime.now().isoformat()
+    metadata['cleaning_date'] = run_ts.isoformat()
     
     metadata_path = output_path.with_suffix('.json')
     save_metadata(metadata, metadata_path)
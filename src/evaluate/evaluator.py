@@ -1,8 +1,29 @@
 import pandas as pd
 import numpy as np
 import joblib
+from functools import lru_cache
 from pathlib import Path
-from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score, mean_absolute_percentage_error
+
+
+@lru_cache(maxsize=8)
+def _load_model_cached(path_str, mtime):
+    """
+    Load a model file, cached per path and modification time.
+    
+    Args:
+        path_str: Resolved path to saved model file
+        mtime: File modification time, part of the cache key only
+        
+    Returns:
+        Loaded model
+    """
+    # Memory-map large numpy arrays of uncompressed models instead of reading them
+    # into memory; joblib cannot memory-map compressed files, which start with a
+    # codec header rather than the pickle PROTO opcode
+    with open(path_str, 'rb') as f:
+        compressed = f.read(1) != b'\x80'
+    
+    return joblib.load(path_str, mmap_mode=None if compressed else 'r')
 
 
 def load_model(model_path):
@@ -15,8 +36,8 @@ def load_model(model_path):
     Returns:
         Loaded model
     """
-    model_path = Path(model_path)
-    model = joblib.load(model_path)
+    model_path = Path(model_path).resolve()
+    model = _load_model_cached(str(model_path), model_path.stat().st_mtime_ns)
     return model
 
 
@@ -29,46 +50,76 @@ def prepare_evaluation_data(df, target_column='temperature'):
         target_column: Name of target variable
         
     Returns:
-        tuple: (X, y, feature_columns)
+        tuple: (X as C-contiguous float32 numpy array, y, feature_columns)
     """
     # Drop columns that shouldn't be features
     exclude_cols = ['timestamp', 'station_id', target_column]
-    feature_cols = [col for col in df.columns if col not in exclude_cols]
+    feature_cols = df.columns.drop(exclude_cols, errors='ignore').tolist()
     
-    X = df[feature_cols]
+    # Plain float32 array so model.predict skips its own DataFrame conversion
+    X = np.ascontiguousarray(df[feature_cols].to_numpy(dtype=np.float32, na_value=np.nan))
     y = df[target_column]
     
     return X, y, feature_cols
 
 
-def evaluate_predictions(y_true, y_pred):
+def regression_metrics(y_true, y_pred, mape=False):
     """
-    Calculate evaluation metrics.
+    Calculate MAE, RMSE and R² (and optionally MAPE) from one error array.
     
     Args:
         y_true: True target values
         y_pred: Predicted target values
+        mape: Also calculate MAPE (default: False)
         
     Returns:
-        dict: Evaluation metrics
+        dict: Metrics (mae, rmse, r2_score, plus mape if requested)
     """
-    mae = mean_absolute_error(y_true, y_pred)
-    rmse = np.sqrt(mean_squared_error(y_true, y_pred))
-    r2 = r2_score(y_true, y_pred)
+    # Accumulate in float64 whatever the input precision
+    actual = np.asarray(y_true, dtype=np.float64)
+    error = actual - np.asarray(y_pred, dtype=np.float64)
+    
+    abs_error = np.abs(error)
+    mae = abs_error.mean()
+    ss_res = np.dot(error, error)
+    rmse = np.sqrt(ss_res / len(error))
     
-    # Calculate MAPE, handle zero values
-    try:
-        mape = mean_absolute_percentage_error(y_true, y_pred)
-    except:
-        mape = None
+    # R² (1.0 for a perfect fit on constant targets, 0.0 otherwise, as sklearn)
+    centered = actual - actual.mean()
+    ss_tot = np.dot(centered, centered)
+    if ss_tot != 0:
+        r2 = 1.0 - ss_res / ss_tot
+    else:
+        r2 = 1.0 if ss_res == 0 else 0.0
     
     metrics = {
         'mae': float(mae),
         'rmse': float(rmse),
-        'r2_score': float(r2),
-        'mape': float(mape) if mape is not None else None
+        'r2_score': float(r2)
     }
     
+    # MAPE from the same arrays, guard zero values with machine epsilon (as sklearn)
+    if mape:
+        scale = np.maximum(np.abs(actual), np.finfo(np.float64).eps)
+        metrics['mape'] = float((abs_error / scale).mean())
+    
+    return metrics
+
+
+def evaluate_predictions(y_true, y_pred):
+    """
+    Calculate evaluation metrics.
+    
+    Args:
+        y_true: True target values
+        y_pred: Predicted target values
+        
+    Returns:
+        dict: Evaluation metrics
+    """
+    # Calculate all metrics, MAPE included, in a single pass over the errors
+    metrics = regression_metrics(y_true, y_pred, mape=True)
+    
     return metrics
 
 
@@ -82,19 +133,48 @@ def create_predictions_dataframe(df, y_true, y_pred):
         y_pred: Predicted target values
         
     Returns:
-        pandas DataFrame with predictions
+        pandas DataFrame with predictions (float32 value and error columns)
     """
+    # Pass timestamps through as-is (zero-copy for Arrow-backed columns)
+    timestamp = df['timestamp'].array
+    
+    # Store values and errors as float32 to halve memory for later scans
+    actual = y_true.to_numpy(dtype=np.float32)
+    predicted = np.asarray(y_pred, dtype=np.float32)
+    error = actual - predicted
+    
     predictions_df = pd.DataFrame({
-        'timestamp': df['timestamp'].values,
-        'actual': y_true.values,
-        'predicted': y_pred,
-        'error': y_true.values - y_pred,
-        'abs_error': np.abs(y_true.values - y_pred)
+        'timestamp': timestamp,
+        'actual': actual,
+        'predicted': predicted,
+        'error': error,
+        'abs_error': np.abs(error)
     })
     
     return predictions_df
 
 
+def percentile_threshold(values, percentile):
+    """
+    Calculate a percentile with linear interpolation, as np.percentile does.
+    
+    Uses an O(N) partial sort around the two neighbouring ranks instead of a full sort.
+    
+    Args:
+        values: 1-D numpy array (non-empty)
+        percentile: Percentile in [0, 100]
+        
+    Returns:
+        float: Percentile value
+    """
+    position = (len(values) - 1) * percentile / 100
+    lower = int(np.floor(position))
+    upper = min(lower + 1, len(values) - 1)
+    partitioned = np.partition(values, [lower, upper])
+    
+    return partitioned[lower] + (partitioned[upper] - partitioned[lower]) * (position - lower)
+
+
 def analyze_errors(predictions_df, threshold_percentile=90):
     """
     Analyze prediction errors to identify failures.
@@ -107,16 +187,18 @@ def analyze_errors(predictions_df, threshold_percentile=90):
         dict: Error analysis statistics
     """
     # Calculate error threshold (90th percentile)
-    error_threshold = np.percentile(predictions_df['abs_error'], threshold_percentile)
+    abs_error = predictions_df['abs_error'].to_numpy(dtype=np.float64)
+    error_threshold = percentile_threshold(abs_error, threshold_percentile)
     
-    # Identify large errors (potential failures)
-    large_errors = predictions_df[predictions_df['abs_error'] > error_threshold]
+    # Count large errors (potential failures) without materializing them
+    large_error_count = int(np.count_nonzero(abs_error > error_threshold))
     
     analysis = {
+        'threshold_percentile': threshold_percentile,
         'error_threshold': float(error_threshold),
         'total_predictions': len(predictions_df),
-        'large_error_count': len(large_errors),
-        'large_error_percentage': float(len(large_errors) / len(predictions_df) * 100),
+        'large_error_count': large_error_count,
+        'large_error_percentage': float(large_error_count / len(predictions_df) * 100),
         'mean_error': float(predictions_df['error'].mean()),
         'std_error': float(predictions_df['error'].std())
     }
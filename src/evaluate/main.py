@@ -1,8 +1,6 @@
 import pandas as pd
 from pathlib import Path
 from datetime import datetime
-import sys
-sys.path.append(str(Path(__file__).parent.parent))
 
 from .evaluator import (
     load_model, 
@@ -11,10 +9,10 @@ from .evaluator import (
     create_predictions_dataframe,
     analyze_errors
 )
-from ingest.logger import save_metadata, log_info
+from ..ingest.logger import save_metadata, load_metadata, log_info, PARQUET_WRITE_OPTIONS
 
 
-def evaluate_model(model_path, data_path, output_dir, target='temperature'):
+def evaluate_model(model_path, data_path, output_dir, target='temperature', run_ts=None):
     """
     Evaluate a trained model on test data.
     
@@ -23,10 +21,15 @@ def evaluate_model(model_path, data_path, output_dir, target='temperature'):
         data_path: Path to featured test data
         output_dir: Directory to save evaluation results
         target: Target variable name
+        run_ts: Run timestamp for output naming and metadata (default: now)
         
     Returns:
         tuple: (success: bool, output_path: str or None)
     """
+    # Capture the run timestamp once for output paths and metadata
+    if run_ts is None:
+        run_ts = datetime.now()
+    
     log_info(f"Starting model evaluation")
     log_info(f"Model: {model_path}")
     log_info(f"Data: {data_path}")
@@ -36,13 +39,25 @@ def evaluate_model(model_path, data_path, output_dir, target='temperature'):
     log_info("Model loaded successfully")
     
     # Load test data
-    df = pd.read_parquet(data_path)
+    # All feature columns are read since the model decides which ones it uses
+    df = pd.read_parquet(data_path, engine='pyarrow', dtype_backend='pyarrow')
     log_info(f"Read {len(df)} rows for evaluation")
     
     # Prepare evaluation data
     X, y_true, feature_cols = prepare_evaluation_data(df, target_column=target)
     log_info(f"Using {len(feature_cols)} features for evaluation")
     
+    # X is a plain array, so check column order against the fitted model
+    # (models trained on arrays carry no names; use the training metadata instead)
+    fitted_features = getattr(model, 'feature_names_in_', None)
+    if fitted_features is None:
+        training_metadata = load_metadata(Path(model_path).with_suffix('.json'))
+        if training_metadata is not None:
+            fitted_features = training_metadata.get('feature_columns')
+    if fitted_features is not None and list(fitted_features) != feature_cols:
+        log_info(f"Feature mismatch: model expects {list(fitted_features)}")
+        return (False, None)
+    
     # Make predictions
     y_pred = model.predict(X)
     log_info("Predictions complete")
@@ -50,8 +65,7 @@ def evaluate_model(model_path, data_path, output_dir, target='temperature'):
     # Evaluate performance
     metrics = evaluate_predictions(y_true, y_pred)
     log_info(f"Evaluation metrics - MAE: {metrics['mae']:.4f}, RMSE: {metrics['rmse']:.4f}, R²: {metrics['r2_score']:.4f}")
-    if metrics['mape'] is not None:
-        log_info(f"MAPE: {metrics['mape']:.4f}")
+    log_info(f"MAPE: {metrics['mape']:.4f}")
     
     # Create predictions DataFrame
     predictions_df = create_predictions_dataframe(df, y_true, y_pred)
@@ -60,19 +74,24 @@ def evaluate_model(model_path, data_path, output_dir, target='temperature'):
     error_analysis = analyze_errors(predictions_df)
     log_info(f"Large errors (>90th percentile): {error_analysis['large_error_count']} ({error_analysis['large_error_percentage']:.2f}%)")
     
+    # Persist failure flags so the failure stage does not recompute them
+    predictions_df['is_failure'] = (
+        predictions_df['abs_error'].to_numpy() > error_analysis['error_threshold']
+    )
+    
     # Create output directory
     output_path = Path(output_dir)
     output_path.mkdir(parents=True, exist_ok=True)
     
     # Save predictions with date
-    date_str = datetime.now().strftime('%Y%m%d')
+    date_str = run_ts.strftime('%Y%m%d')
     predictions_path = output_path / f'evaluation_results_{date_str}.parquet'
-    predictions_df.to_parquet(predictions_path, index=False)
+    predictions_df.to_parquet(predictions_path, **PARQUET_WRITE_OPTIONS)
     log_info(f"Saved predictions to {predictions_path}")
     
     # Create and save metadata
     metadata = {
-        'evaluation_date': datetime.now().isoformat(),
+        'evaluation_date': run_ts.isoformat(),
         'model_path': str(model_path),
         'test_samples': len(df),
         'metrics': metrics,
@@ -1,23 +1,49 @@
 import pandas as pd
 import numpy as np
 
+from ..evaluate.evaluator import percentile_threshold
 
-def identify_failures(predictions_df, threshold_percentile=90):
+
+# Contributing features summary indexed by bit code
+# (bit 0: high humidity, bit 1: rapid pressure change, bit 2: rapid temp change)
+_CONTRIBUTING_FEATURES_LOOKUP = np.array([
+    'normal_conditions',
+    'high_humidity',
+    'rapid_pressure_change',
+    'high_humidity, rapid_pressure_change',
+    'rapid_temp_change',
+    'high_humidity, rapid_temp_change',
+    'rapid_pressure_change, rapid_temp_change',
+    'high_humidity, rapid_pressure_change, rapid_temp_change',
+], dtype=object)
+
+
+def identify_failures(predictions_df, threshold_percentile=90, error_threshold=None):
     """
     Identify prediction failures based on error threshold.
     
     Args:
         predictions_df: DataFrame with predictions and errors
         threshold_percentile: Percentile for defining failures
+        error_threshold: Precomputed threshold (optional). When given, the
+            'is_failure' column saved by evaluation is used as the failure mask
         
     Returns:
         tuple: (failures DataFrame, threshold value)
     """
-    # Calculate error threshold
-    error_threshold = np.percentile(predictions_df['abs_error'], threshold_percentile)
+    abs_error = predictions_df['abs_error'].to_numpy(dtype=np.float64)
+    
+    if error_threshold is not None and 'is_failure' in predictions_df.columns:
+        # Reuse the failure flags computed during evaluation
+        is_failure = predictions_df['is_failure'].to_numpy(dtype=bool)
+    else:
+        if error_threshold is None:
+            # Calculate error threshold
+            error_threshold = percentile_threshold(abs_error, threshold_percentile)
+        is_failure = abs_error > error_threshold
     
     # Identify failures (predictions with large errors)
-    failures = predictions_df[predictions_df['abs_error'] > error_threshold].copy()
+    failures = predictions_df[is_failure].copy()
     
     return failures, error_threshold
 
@@ -32,23 +58,17 @@ def categorize_failures(failures_df):
     Returns:
         DataFrame with failure categories added
     """
-    failures = failures_df.copy()
-    
-    # Categorize based on error characteristics
-    def categorize_error(row):
-        error = row['error']
-        abs_error = row['abs_error']
-        
-        if abs_error > 1.5:
-            return 'extreme_error'
-        elif error > 0:
-            return 'overestimation'
-        elif error < 0:
-            return 'underestimation'
-        else:
-            return 'unknown'
+    # Categorize based on error characteristics (first matching condition wins)
+    error = failures_df['error'].to_numpy()
+    abs_error = failures_df['abs_error'].to_numpy()
+    
+    failure_type = np.select(
+        [abs_error > 1.5, error > 0, error < 0],
+        ['extreme_error', 'overestimation', 'underestimation'],
+        default='unknown'
+    )
     
-    failures['failure_type'] = failures.apply(categorize_error, axis=1)
+    failures = failures_df.assign(failure_type=pd.Categorical(failure_type))
     
     return failures
 
@@ -78,8 +98,7 @@ def analyze_failure_patterns(failures_df):
         'total_failures': len(failures_df),
         'failure_types': failure_types,
         'avg_failure_magnitude': float(failures_df['abs_error'].mean()),
-        'max_failure_magnitude': float(failures_df['abs_error'].max()),
-        'failure_timestamps': failures_df['timestamp'].tolist()
+        'max_failure_magnitude': float(failures_df['abs_error'].max())
     }
     
     return patterns
@@ -96,40 +115,45 @@ def add_failure_context(failures_df, original_df):
     Returns:
         DataFrame with context added
     """
-    failures_enriched = failures_df.copy()
-    
     # Extract features that might contribute to failures
     feature_cols = ['humidity', 'pressure', 'temp_change_1h', 'pressure_change_1h']
     
-    # Merge with original data to get features
-    failures_enriched = failures_enriched.merge(
-        original_df[['timestamp'] + feature_cols],
-        on='timestamp',
-        how='left'
-    )
-    
-    # Create contributing features summary
-    def get_contributing_features(row):
-        contributors = []
-        
-        # Check for extreme values
-        if 'humidity' in row and row['humidity'] > 90:
-            contributors.append('high_humidity')
-        if 'pressure_change_1h' in row and abs(row['pressure_change_1h']) > 2:
-            contributors.append('rapid_pressure_change')
-        if 'temp_change_1h' in row and abs(row['temp_change_1h']) > 2:
-            contributors.append('rapid_temp_change')
-        
-        return ', '.join(contributors) if contributors else 'normal_conditions'
-    
-    failures_enriched['contributing_features'] = failures_enriched.apply(
-        get_contributing_features, axis=1
-    )
+    # Binary search failure timestamps in the timestamp-sorted original data
+    if not original_df['timestamp'].is_monotonic_increasing:
+        original_df = original_df.sort_values('timestamp')
+    original_ts = original_df['timestamp'].to_numpy()
+    failure_ts = failures_df['timestamp'].to_numpy()
+    
+    idx = np.searchsorted(original_ts, failure_ts)
+    found = idx < len(original_ts)
+    found[found] = original_ts[idx[found]] == failure_ts[found]
+    
+    # Gather features for matched timestamps (NaN where unmatched, as in a left join)
+    context = {}
+    for col in feature_cols:
+        values = np.full(len(failures_df), np.nan)
+        values[found] = original_df[col].to_numpy(dtype=np.float64, na_value=np.nan)[idx[found]]
+        context[col] = values
+    
+    failures_enriched = failures_df.assign(**context)
+    
+    # Flag each contributing condition as one bit of a 3-bit code
+    high_humidity = (failures_enriched['humidity'].to_numpy() > 90).astype(np.uint8)
+    rapid_pressure = (
+        np.abs(failures_enriched['pressure_change_1h'].to_numpy()) > 2
+    ).astype(np.uint8) << 1
+    rapid_temp = (
+        np.abs(failures_enriched['temp_change_1h'].to_numpy()) > 2
+    ).astype(np.uint8) << 2
+    codes = high_humidity | rapid_pressure | rapid_temp
+    
+    # Map each code to its contributing features summary
+    failures_enriched['contributing_features'] = _CONTRIBUTING_FEATURES_LOOKUP[codes]
     
     return failures_enriched
 
 
-def create_failure_summary(failures_df, threshold, patterns):
+def create_failure_summary(failures_df, threshold, patterns, total_predictions):
     """
     Create a summary of failure analysis.
     
@@ -137,6 +161,7 @@ def create_failure_summary(failures_df, threshold, patterns):
         failures_df: DataFrame with analyzed failures
         threshold: Error threshold used
         patterns: Failure patterns dict
+        total_predictions: Number of predictions the failures were identified from
         
     Returns:
         dict: Summary statistics
@@ -144,7 +169,7 @@ def create_failure_summary(failures_df, threshold, patterns):
     summary = {
         'error_threshold': float(threshold),
         'total_failures': patterns['total_failures'],
-        'failure_rate': float(patterns['total_failures'] / len(failures_df) * 100) if len(failures_df) > 0 else 0.0,
+        'failure_rate': float(patterns['total_failures'] / total_predictions * 100),
         'failure_types': patterns['failure_types'],
         'avg_failure_magnitude': patterns['avg_failure_magnitude'],
         'max_failure_magnitude': patterns.get('max_failure_magnitude', 0.0)
@@ -1,8 +1,6 @@
 import pandas as pd
 from pathlib import Path
 from datetime import datetime
-import sys
-sys.path.append(str(Path(__file__).parent.parent))
 
 from .analyzer import (
     identify_failures,
@@ -11,10 +9,18 @@ from .analyzer import (
     add_failure_context,
     create_failure_summary
 )
-from ingest.logger import save_metadata, log_info
+from ..ingest.logger import load_metadata, save_metadata, log_info, PARQUET_WRITE_OPTIONS
 
+# Columns read from the evaluation results parquet file
+PREDICTION_COLS = ['timestamp', 'actual', 'predicted', 'error', 'abs_error']
 
-def analyze_failures(predictions_path, features_path, output_dir, threshold_percentile=90):
+# Columns read from the features parquet file for failure context
+FEATURE_COLS = ['timestamp', 'humidity', 'pressure', 'temp_change_1h', 'pressure_change_1h']
+
+
+def analyze_failures(
+    predictions_path, features_path, output_dir, threshold_percentile=90, run_ts=None
+):
     """
     Analyze model prediction failures.
     
@@ -23,30 +29,56 @@ def analyze_failures(predictions_path, features_path, output_dir, threshold_perc
         features_path: Path to original features data
         output_dir: Directory to save failure analysis
         threshold_percentile: Percentile for failure threshold
+        run_ts: Run timestamp for output naming and metadata (default: now)
         
     Returns:
         tuple: (success: bool, output_path: str or None)
     """
+    # Capture the run timestamp once for output paths and metadata
+    if run_ts is None:
+        run_ts = datetime.now()
+    
     log_info(f"Starting failure analysis")
     log_info(f"Predictions: {predictions_path}")
     log_info(f"Features: {features_path}")
     
+    # Reuse the threshold and failure flags from evaluation if computed at this percentile
+    precomputed_threshold = None
+    columns = PREDICTION_COLS
+    evaluation_metadata = load_metadata(Path(predictions_path).with_suffix('.json'))
+    if evaluation_metadata is not None:
+        error_analysis = evaluation_metadata.get('error_analysis', {})
+        if error_analysis.get('threshold_percentile') == threshold_percentile:
+            precomputed_threshold = error_analysis['error_threshold']
+            columns = PREDICTION_COLS + ['is_failure']
+    
     # Load predictions
-    predictions_df = pd.read_parquet(predictions_path)
+    predictions_df = pd.read_parquet(
+        predictions_path, columns=columns, engine='pyarrow', dtype_backend='pyarrow'
+    )
     log_info(f"Loaded {len(predictions_df)} predictions")
     
-    # Load original features for context
-    features_df = pd.read_parquet(features_path)
-    log_info(f"Loaded original features")
-    
     # Identify failures
-    failures_df, threshold = identify_failures(predictions_df, threshold_percentile)
+    failures_df, threshold = identify_failures(
+        predictions_df, threshold_percentile, error_threshold=precomputed_threshold
+    )
     log_info(f"Identified {len(failures_df)} failures with threshold: {threshold:.4f}")
     
     if len(failures_df) == 0:
         log_info("No failures detected - model performs well across all predictions")
         return (True, None)
     
+    # Load original features for context, only for failure timestamps
+    failure_timestamps = failures_df['timestamp'].unique().tolist()
+    features_df = pd.read_parquet(
+        features_path,
+        columns=FEATURE_COLS,
+        engine='pyarrow',
+        dtype_backend='pyarrow',
+        filters=[('timestamp', 'in', failure_timestamps)]
+    )
+    log_info(f"Loaded original features for {len(features_df)} failure timestamps")
+    
     # Categorize failures
     failures_df = categorize_failures(failures_df)
     log_info("Categorized failure types")
@@ -60,7 +92,7 @@ def analyze_failures(predictions_path, features_path, output_dir, threshold_perc
     log_info("Added contextual information to failures")
     
     # Create summary
-    summary = create_failure_summary(predictions_df, threshold, patterns)
+    summary = create_failure_summary(failures_df, threshold, patterns, len(predictions_df))
     log_info(f"Failure rate: {summary['failure_rate']:.2f}%")
     log_info(f"Average failure magnitude: {summary['avg_failure_magnitude']:.4f}")
     
@@ -69,7 +101,7 @@ def analyze_failures(predictions_path, features_path, output_dir, threshold_perc
     output_path.mkdir(parents=True, exist_ok=True)
     
     # Save failure analysis with date
-    date_str = datetime.now().strftime('%Y%m%d')
+    date_str = run_ts.strftime('%Y%m%d')
     analysis_path = output_path / f'failure_analysis_{date_str}.parquet'
     
     # Select relevant columns for output
@@ -77,12 +109,19 @@ def analyze_failures(predictions_path, features_path, output_dir, threshold_perc
         'timestamp', 'actual', 'predicted', 'error', 'abs_error',
         'failure_type', 'contributing_features'
     ]
-    failures_df[output_columns].to_parquet(analysis_path, index=False)
+    output_df = failures_df[output_columns]
+    
+    # Low-cardinality labels as categoricals (int codes + small dictionary)
+    output_df = output_df.astype({
+        'failure_type': 'category',
+        'contributing_features': 'category'
+    })
+    output_df.to_parquet(analysis_path, **PARQUET_WRITE_OPTIONS)
     log_info(f"Saved failure analysis to {analysis_path}")
     
     # Create and save metadata
     metadata = {
-        'analysis_date': datetime.now().isoformat(),
+        'analysis_date': run_ts.isoformat(),
         'total_failures': summary['total_failures'],
         'failure_threshold': summary['error_threshold'],
         'failure_rate': summary['failure_rate'],
@@ -2,33 +2,117 @@ import pandas as pd
 import numpy as np
 
 
-def add_rolling_features(df, window=24):
+def _rolling_columns(df, window=24):
     """
-    Add rolling window features.
+    Compute rolling window feature columns.
     
     Args:
         df: pandas DataFrame with weather data
         window: Rolling window size in hours (default 24)
         
     Returns:
-        pandas DataFrame: DataFrame with rolling features added
+        dict: Feature name to column values
     """
-    df_features = df.copy()
-    
-    # 24-hour rolling mean for temperature
-    df_features['temp_rolling_mean_24h'] = df_features['temperature'].rolling(
-        window=window, min_periods=1
-    ).mean()
+    # Rolling mean and std for temperature from one Rolling object (float64 numpy input)
+    temperature = df['temperature'].to_numpy(dtype=np.float64, na_value=np.nan)
+    rolling = pd.Series(temperature).rolling(window=window, min_periods=1)
+    rolling_mean = rolling.mean().to_numpy()
+    rolling_std = rolling.std().to_numpy()
+    
+    return {
+        # 24-hour rolling mean for temperature
+        'temp_rolling_mean_24h': rolling_mean,
+        # 24-hour rolling std for temperature (variability),
+        # NaN values that might appear at the start filled with 0
+        'temp_rolling_std_24h': np.nan_to_num(rolling_std, nan=0.0)
+    }
+
+
+def _change_columns(df):
+    """
+    Compute rate of change feature columns.
     
-    # 24-hour rolling std for temperature (variability)
-    df_features['temp_rolling_std_24h'] = df_features['temperature'].rolling(
-        window=window, min_periods=1
-    ).std()
+    Args:
+        df: pandas DataFrame with weather data
+        
+    Returns:
+        dict: Feature name to column values
+    """
+    # Stack columns into one contiguous (3, N) block and diff them together
+    values = np.stack([
+        df[col].to_numpy(dtype=np.float32, na_value=np.nan)
+        for col in ['temperature', 'pressure', 'humidity']
+    ])
+    
+    # Change over last hour, first value 0 (no previous value)
+    changes = np.empty_like(values)
+    changes[:, :1] = 0
+    changes[:, 1:] = np.diff(values, axis=1)
+    
+    # Changes involving missing values are 0
+    changes[np.isnan(changes)] = 0
+    
+    return {
+        'temp_change_1h': changes[0],
+        'pressure_change_1h': changes[1],
+        'humidity_change_1h': changes[2]
+    }
+
+
+def _time_columns(df):
+    """
+    Compute time-based feature columns from timestamp.
     
-    # Fill NaN values that might appear at the start
-    df_features['temp_rolling_std_24h'] = df_features['temp_rolling_std_24h'].fillna(0)
+    Args:
+        df: pandas DataFrame with timestamp column
+        
+    Returns:
+        dict: Feature name to column values
+    """
+    # Tz-aware timestamps use local wall time, as the .dt accessors do
+    # (via DatetimeIndex: Arrow-backed tz_localize(None) would return UTC)
+    timestamp = df['timestamp']
+    if timestamp.dt.tz is not None:
+        timestamp = pd.DatetimeIndex(timestamp).tz_localize(None)
+    
+    # Integer arithmetic on epoch seconds instead of .dt accessors
+    wall_time = timestamp.to_numpy().astype('datetime64[s]')
+    missing = np.isnat(wall_time)
+    epoch = wall_time.astype(np.int64)
+    
+    # Hour of day
+    hour = ((epoch // 3600) % 24).astype(np.int8)
+    
+    # Day of week (0=Monday, 6=Sunday), 1970-01-01 was a Thursday
+    day_of_week = (((epoch // 86400) + 3) % 7).astype(np.int8)
+    
+    # Missing timestamps are not a weekend
+    is_weekend = ((day_of_week >= 5) & ~missing).astype(np.int8)
+    
+    # Missing timestamps have no hour or day (nullable Int8 only when needed)
+    if missing.any():
+        hour = pd.arrays.IntegerArray(hour, missing)
+        day_of_week = pd.arrays.IntegerArray(day_of_week, missing)
+    
+    return {
+        'hour': hour,
+        'day_of_week': day_of_week,
+        'is_weekend': is_weekend
+    }
+
+
+def add_rolling_features(df, window=24):
+    """
+    Add rolling window features.
     
-    return df_features
+    Args:
+        df: pandas DataFrame with weather data
+        window: Rolling window size in hours (default 24)
+        
+    Returns:
+        pandas DataFrame: DataFrame with rolling features added
+    """
+    return df.assign(**_rolling_columns(df, window=window))
 
 
 def add_change_features(df):
@@ -41,23 +125,7 @@ def add_change_features(df):
     Returns:
         pandas DataFrame: DataFrame with change features added
     """
-    df_features = df.copy()
-    
-    # Temperature change over last hour
-    df_features['temp_change_1h'] = df_features['temperature'].diff()
-    
-    # Pressure change over last hour
-    df_features['pressure_change_1h'] = df_features['pressure'].diff()
-    
-    # Humidity change over last hour
-    df_features['humidity_change_1h'] = df_features['humidity'].diff()
-    
-    # Fill first NaN with 0 (no previous value)
-    df_features['temp_change_1h'] = df_features['temp_change_1h'].fillna(0)
-    df_features['pressure_change_1h'] = df_features['pressure_change_1h'].fillna(0)
-    df_features['humidity_change_1h'] = df_features['humidity_change_1h'].fillna(0)
-    
-    return df_features
+    return df.assign(**_change_columns(df))
 
 
 def add_time_features(df):
@@ -70,18 +138,7 @@ def add_time_features(df):
     Returns:
         pandas DataFrame: DataFrame with time features added
     """
-    df_features = df.copy()
-    
-    # Extract hour of day
-    df_features['hour'] = df_features['timestamp'].dt.hour
-    
-    # Extract day of week (0=Monday, 6=Sunday)
-    df_features['day_of_week'] = df_features['timestamp'].dt.dayofweek
-    
-    # Is weekend flag
-    df_features['is_weekend'] = (df_features['day_of_week'] >= 5).astype(int)
-    
-    return df_features
+    return df.assign(**_time_columns(df))
 
 
 def create_features(df):
@@ -96,10 +153,12 @@ def create_features(df):
     """
     initial_columns = len(df.columns)
     
-    # Add all features
-    df_featured = add_rolling_features(df, window=24)
-    df_featured = add_change_features(df_featured)
-    df_featured = add_time_features(df_featured)
+    # Compute all features from the input and add them in a single step
+    df_featured = df.assign(
+        **_rolling_columns(df, window=24),
+        **_change_columns(df),
+        **_time_columns(df)
+    )
     
     final_columns = len(df_featured.columns)
     features_added = final_columns - initial_columns
@@ -1,7 +1,49 @@
 import yaml
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
 import pandas as pd
 
+# Use the LibYAML C parser when available
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
+
+def _freeze(value):
+    """
+    Recursively convert dicts and lists to read-only equivalents.
+
+    Args:
+        value: Parsed YAML value
+
+    Returns:
+        Read-only value (MappingProxyType for dicts, tuple for lists)
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+@lru_cache(maxsize=8)
+def _load_schema_cached(path_str, mtime):
+    """
+    Read and parse a schema YAML file, cached per path and modification time.
+
+    Args:
+        path_str: Resolved path to schema YAML file
+        mtime: File modification time, part of the cache key only
+
+    Returns:
+        MappingProxyType: Read-only schema definition
+    """
+    with open(path_str, 'r') as f:
+        return _freeze(yaml.load(f, Loader=_Loader))
+
+
 def load_schema(schema_path):
     """
     Load schema definition from YAML file.
@@ -10,14 +52,13 @@ def load_schema(schema_path):
         schema_path: Path to schema YAML file
 
     Returns:
-        dict: Schema definition
+        MappingProxyType: Read-only schema definition, shared between calls
     """
     # Convert to Path object
-    schema_path = Path(schema_path)
+    schema_path = Path(schema_path).resolve()
     
-    # Read and parse YAML file
-    with open(schema_path, 'r') as f:
-        return yaml.safe_load(f)
+    # Parse once per file version, edits invalidate the cache via mtime
+    return _load_schema_cached(str(schema_path), schema_path.stat().st_mtime_ns)
     
 
 def check_required_columns(df, schema):
@@ -1,24 +1,50 @@
 import json
+import sys
+import time
 from datetime import datetime
 from pathlib import Path
 
-def create_metadata(df, station_id, file_path):
+import orjson
+
+LOG_TIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+# DataFrame.to_parquet options shared by the pipeline stages
+PARQUET_WRITE_OPTIONS = {
+    'index': False,
+    'engine': 'pyarrow',
+    'compression': 'zstd',
+    'compression_level': 3,
+    'row_group_size': 65536,
+    'use_dictionary': True,
+    'data_page_size': 1 << 20
+}
+
+
+def create_metadata(df, station_id, file_path, total_rows=None, run_ts=None):
     """
     Create metadata dict for ingested data.
 
     Args:
-        df: pandas DataFrame
+        df: pandas DataFrame (may be None when total_rows is given)
         station_id: str, weather station identifier
         file_path: str, path where data will be saved
+        total_rows: int, row count for data not held in memory (optional)
+        run_ts: datetime, run timestamp recorded as ingestion date (default: now)
 
     Returns:
         dict: Metadata according to contract
     """
+    if total_rows is None:
+        total_rows = len(df)
+    
+    if run_ts is None:
+        run_ts = datetime.now()
+    
     # Build metadata dict according to schema contract
     metadata = {
-        'ingestion_date': datetime.now().isoformat(),
+        'ingestion_date': run_ts.isoformat(),
         'source_station': station_id,
-        'total_rows': len(df),
+        'total_rows': total_rows,
         'file_path': str(file_path)
     }
     
@@ -35,12 +61,32 @@ def save_metadata(metadata, output_path):
     """
     output_path = Path(output_path)
     
-    # Write metadata as formatted JSON
-    with open(output_path, 'w') as f:
-        json.dump(metadata, f, indent=2)
+    # Write metadata as formatted JSON (numpy scalars are serialized natively)
+    output_path.write_bytes(
+        orjson.dumps(metadata, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+    )
+
+
+def load_metadata(metadata_path):
+    """
+    Load metadata from JSON file.
+
+    Args:
+        metadata_path: Path to metadata JSON
+
+    Returns:
+        dict: Metadata, or None if the file does not exist
+    """
+    metadata_path = Path(metadata_path)
+    
+    if not metadata_path.exists():
+        return None
+    
+    with open(metadata_path, 'r') as f:
+        return json.load(f)
 
 
 def log_info(message):
     """Simple console logging with timestamp."""
-    timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-    print(f"[{timestamp}] INFO: {message}")
\ No newline at end of file
+    timestamp = time.strftime(LOG_TIME_FORMAT, time.localtime())
+    sys.stdout.write(f"[{timestamp}] INFO: {message}\n")
\ No newline at end of file
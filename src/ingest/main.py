@@ -1,10 +1,77 @@
-import pandas as pd
+import csv
+import re
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
 from pathlib import Path
 from datetime import datetime
-from .validator import load_schema, validate_dataframe
+from .validator import load_schema, validate_arrow_schema
 from .logger import create_metadata, save_metadata, log_info
 
-def ingest_data(source_path, output_dir, station_id):
+# Rows per parquet row group, CSV batches are combined up to this size
+ROW_GROUP_SIZE = 131072
+
+# Ingest schema contract, resolved once at import
+_SCHEMA_PATH = Path(__file__).resolve().parents[2] / 'schemas' / 'ingest.yaml'
+
+# Arrow types for schema column types (datetime64 is resolved per file)
+_ARROW_TYPES = {
+    'float64': pa.float64(),
+    'string': pa.string()
+}
+
+# Zone offset (Z, +HH:MM or +HHMM) at the end of a timestamp value
+_ZONE_OFFSET = re.compile(r'(?:Z|([+-]\d{2}):?(\d{2}))$')
+
+
+def _timestamp_type(source_path):
+    """
+    Choose the Arrow timestamp type from the first data row of a CSV file.
+
+    Args:
+        source_path: Path to source CSV file
+
+    Returns:
+        pyarrow DataType: Timestamp in the first value's zone offset, naive if it has none
+    """
+    with open(source_path, 'r', newline='') as f:
+        reader = csv.reader(f)
+        header = next(reader, [])
+        first_row = next(reader, [])
+    
+    if 'timestamp' in header and len(first_row) == len(header):
+        value = first_row[header.index('timestamp')].strip()
+        # Only look past the date part, whose dashes would look like an offset
+        match = _ZONE_OFFSET.search(value[10:])
+        if match:
+            hours, minutes = match.groups()
+            return pa.timestamp('ns', tz=f'{hours}:{minutes}' if hours else 'UTC')
+    
+    return pa.timestamp('ns')
+
+
+def _column_types(schema, source_path):
+    """
+    Build Arrow CSV column types from the schema, so types are not guessed per block.
+
+    Args:
+        schema: Schema dict from load_schema()
+        source_path: Path to source CSV file
+
+    Returns:
+        dict: Column name to pyarrow DataType
+    """
+    column_types = {}
+    for col_name, col_info in schema['columns'].items():
+        if col_info['type'] == 'datetime64':
+            column_types[col_name] = _timestamp_type(source_path)
+        elif col_info['type'] in _ARROW_TYPES:
+            column_types[col_name] = _ARROW_TYPES[col_info['type']]
+    
+    return column_types
+
+
+def ingest_data(source_path, output_dir, station_id, run_ts=None):
     """
     Ingest weather data from CSV to parquet format.
 
@@ -12,36 +79,78 @@ def ingest_data(source_path, output_dir, station_id):
         source_path: Path to source CSV file
         output_dir: Directory to save output files
         station_id: Weather station identifier
+        run_ts: Run timestamp for output naming and metadata (default: now)
 
     Returns:
         tuple: (success: bool, output_path: str or None)
     """
+    # Capture the run timestamp once for output paths and metadata
+    if run_ts is None:
+        run_ts = datetime.now()
+    
     log_info(f"Starting ingestion from {source_path}")
     
-    # Read CSV and parse timestamp column
-    df = pd.read_csv(source_path, parse_dates=['timestamp'])
-    log_info(f"Read {len(df)} rows from source")
+    # Load schema, it also fixes the column types for parsing
+    schema = load_schema(_SCHEMA_PATH)
     
-    # Load and validate against schema
-    schema_path = Path(__file__).parent.parent.parent / 'schemas' / 'ingest.yaml'
-    schema = load_schema(schema_path)
+    # Open CSV as a stream of record batches with schema column types
+    reader = pa_csv.open_csv(
+        source_path,
+        convert_options=pa_csv.ConvertOptions(column_types=_column_types(schema, source_path))
+    )
     
-    is_valid, errors = validate_dataframe(df, schema)
+    # Validate against schema (columns only, before reading any rows)
+    is_valid, errors = validate_arrow_schema(reader.schema, schema)
     if not is_valid:
         log_info(f"Validation failed: {errors}")
         return (False, None)
     log_info("Validation passed")
     
     # Create output path with date
-    date_str = datetime.now().strftime('%Y%m%d')
+    date_str = run_ts.strftime('%Y%m%d')
     output_path = Path(output_dir) / f'weather_{date_str}.parquet'
     
-    # Save as parquet format
-    df.to_parquet(output_path, index=False)
+    # Stream batches into a temporary file, one combined chunk per row group;
+    # it only replaces the output once every batch has been parsed
+    tmp_path = output_path.with_name(output_path.name + '.tmp')
+    total_rows = 0
+    pending = []
+    pending_rows = 0
+    try:
+        with pq.ParquetWriter(
+            tmp_path,
+            reader.schema,
+            compression='zstd',
+            compression_level=1,
+            use_dictionary=True
+        ) as writer:
+            for batch in reader:
+                pending.append(batch)
+                pending_rows += batch.num_rows
+                total_rows += batch.num_rows
+                if pending_rows >= ROW_GROUP_SIZE:
+                    # Write all full row groups, carry the remainder to the next batch
+                    table = pa.Table.from_batches(pending, schema=reader.schema)
+                    full_rows = pending_rows - pending_rows % ROW_GROUP_SIZE
+                    writer.write_table(
+                        table.slice(0, full_rows).combine_chunks(), row_group_size=ROW_GROUP_SIZE
+                    )
+                    pending = table.slice(full_rows).to_batches()
+                    pending_rows -= full_rows
+            if pending_rows > 0:
+                table = pa.Table.from_batches(pending, schema=reader.schema).combine_chunks()
+                writer.write_table(table, row_group_size=ROW_GROUP_SIZE)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    tmp_path.replace(output_path)
+    log_info(f"Read {total_rows} rows from source")
     log_info(f"Saved data to {output_path}")
     
     # Create and save metadata
-    metadata = create_metadata(df, station_id, str(output_path))
+    metadata = create_metadata(
+        None, station_id, str(output_path), total_rows=total_rows, run_ts=run_ts
+    )
     metadata_path = output_path.with_suffix('.json')
     save_metadata(metadata, metadata_path)
     log_info(f"Saved metadata to {metadata_path}")
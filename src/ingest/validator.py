@@ -1,7 +1,49 @@
 import yaml
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
 import pandas as pd
 
+# Use the LibYAML C parser when available
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
+
+def _freeze(value):
+    """
+    Recursively convert dicts and lists to read-only equivalents.
+
+    Args:
+        value: Parsed YAML value
+
+    Returns:
+        Read-only value (MappingProxyType for dicts, tuple for lists)
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+@lru_cache(maxsize=32)
+def _load_schema_cached(path_str, mtime):
+    """
+    Read and parse a schema YAML file, cached per path and modification time.
+
+    Args:
+        path_str: Resolved path to schema YAML file
+        mtime: File modification time, part of the cache key only
+
+    Returns:
+        MappingProxyType: Read-only schema definition
+    """
+    with open(path_str, 'r') as f:
+        return _freeze(yaml.load(f, Loader=_Loader))
+
+
 def load_schema(schema_path):
     """
     Load schema definition from YAML file.
@@ -10,14 +52,13 @@ def load_schema(schema_path):
         schema_path: Path to schema YAML file
 
     Returns:
-        dict: Schema definition
+        MappingProxyType: Read-only schema definition, shared between calls
     """
     # Convert to Path object
-    schema_path = Path(schema_path)
+    schema_path = Path(schema_path).resolve()
     
-    # Read and parse YAML file
-    with open(schema_path, 'r') as f:
-        return yaml.safe_load(f)
+    # Parse once per file version, edits invalidate the cache via mtime
+    return _load_schema_cached(str(schema_path), schema_path.stat().st_mtime_ns)
     
 
 def check_required_columns(df, schema):
@@ -31,16 +72,13 @@ def check_required_columns(df, schema):
     Returns:
         list: Missing required column names (empty if all present)
     """
-    missing = []
+    # Hash-based membership instead of scanning df.columns per required column
+    present = set(df.columns)
     
-    # Check each column in schema
-    for col_name, col_info in schema['columns'].items():
-        # If column is required, verify it exists
-        if col_info.get('required', False):
-            if col_name not in df.columns:
-                missing.append(col_name)
-    
-    return missing
+    return [
+        col_name for col_name, col_info in schema['columns'].items()
+        if col_info.get('required', False) and col_name not in present
+    ]
 
 
 def validate_dataframe(df, schema):
@@ -64,4 +102,32 @@ def validate_dataframe(df, schema):
     # Determine if validation passed
     is_valid = len(errors) == 0
     
-    return (is_valid, errors)
\ No newline at end of file
+    return (is_valid, errors)
+
+
+def validate_arrow_schema(arrow_schema, yaml_schema):
+    """
+    Validate an Arrow schema (e.g. a CSV reader's) against schema, without reading rows.
+
+    Args:
+        arrow_schema: pyarrow Schema to validate
+        yaml_schema: Schema dict from load_schema()
+
+    Returns:
+        tuple: (is_valid: bool, errors: list of str)
+    """
+    errors = []
+    
+    # Check for missing required columns by field name
+    present = set(arrow_schema.names)
+    missing = [
+        col_name for col_name, col_info in yaml_schema['columns'].items()
+        if col_info.get('required', False) and col_name not in present
+    ]
+    if missing:
+        errors.append(f"Missing required columns: {missing}")
+    
+    # Determine if validation passed
+    is_valid = len(errors) == 0
+    
+    return (is_valid, errors)
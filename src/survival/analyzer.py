@@ -1,7 +1,5 @@
 import pandas as pd
 import numpy as np
-from lifelines import KaplanMeierFitter
-from lifelines.statistics import logrank_test
 
 
 def prepare_survival_data(predictions_df, error_threshold):
@@ -15,13 +13,18 @@ def prepare_survival_data(predictions_df, error_threshold):
     Returns:
         pandas DataFrame with survival data
     """
-    survival_df = predictions_df.copy()
+    n = len(predictions_df)
+    abs_error = predictions_df['abs_error'].to_numpy()
+    
+    # Default RangeIndex for the output, whatever index the predictions carry
+    # (shares the predictions' data under copy-on-write; new columns are added in place)
+    survival_df = predictions_df.reset_index(drop=True)
     
     # Define event (1 = failure/large error, 0 = censored/good prediction)
-    survival_df['event'] = (survival_df['abs_error'] > error_threshold).astype(int)
+    survival_df['event'] = (abs_error > error_threshold).astype(np.int8)
     
     # Calculate duration (time index - sequential order)
-    survival_df['duration'] = range(1, len(survival_df) + 1)
+    survival_df['duration'] = np.arange(1, n + 1, dtype=np.int32)
     
     # Extract station_id if available
     if 'station_id' not in survival_df.columns:
@@ -30,9 +33,28 @@ def prepare_survival_data(predictions_df, error_threshold):
     return survival_df
 
 
+def estimate_survival_function(survival_df):
+    """
+    Estimate the Kaplan-Meier survival curve directly with NumPy.
+    
+    With durations 1..n (one observation each) the estimator reduces to
+    S(i) = prod_{k<=i} (1 - event_k / at_risk_k) with at_risk_k = n - k + 1.
+    
+    Args:
+        survival_df: DataFrame with survival data
+        
+    Returns:
+        numpy array: Survival probability at each duration
+    """
+    events = survival_df['event'].to_numpy(dtype=np.float64)
+    at_risk = np.arange(len(events), 0, -1, dtype=np.float64)
+    
+    return np.cumprod(1.0 - events / at_risk)
+
+
 def fit_kaplan_meier(survival_df):
     """
-    Fit Kaplan-Meier survival curve.
+    Fit Kaplan-Meier survival curve with lifelines (optional cross-check).
     
     Args:
         survival_df: DataFrame with survival data
@@ -40,6 +62,8 @@ def fit_kaplan_meier(survival_df):
     Returns:
         KaplanMeierFitter object
     """
+    from lifelines import KaplanMeierFitter
+    
     kmf = KaplanMeierFitter()
     kmf.fit(
         durations=survival_df['duration'],
@@ -50,25 +74,28 @@ def fit_kaplan_meier(survival_df):
     return kmf
 
 
-def calculate_survival_statistics(kmf, survival_df):
+def calculate_survival_statistics(survival_df, kmf=None):
     """
     Calculate survival statistics.
     
     Args:
-        kmf: Fitted KaplanMeierFitter
         survival_df: Original survival DataFrame
+        kmf: Fitted KaplanMeierFitter (optional, otherwise estimated with NumPy)
         
     Returns:
         dict: Survival statistics
     """
     # Get survival function values
-    survival_function = kmf.survival_function_
+    if kmf is None:
+        timeline = survival_df['duration'].to_numpy()
+        survival_function = estimate_survival_function(survival_df)
+    else:
+        timeline = kmf.survival_function_.index.to_numpy()
+        survival_function = kmf.survival_function_.iloc[:, 0].to_numpy()
     
-    # Calculate median survival time (if exists)
-    try:
-        median_survival = kmf.median_survival_time_
-    except:
-        median_survival = None
+    # Calculate median survival time: first time survival drops to 0.5 or below (if exists)
+    median_index = np.searchsorted(-survival_function, -0.5)
+    median_survival = timeline[median_index] if median_index < len(timeline) else None
     
     # Count events
     total_observations = len(survival_df)
@@ -76,12 +103,12 @@ def calculate_survival_statistics(kmf, survival_df):
     censored_count = total_observations - events_count
     
     stats = {
-        'total_observations': int(total_observations),
-        'events_count': int(events_count),
-        'censored_count': int(censored_count),
-        'event_rate': float(events_count / total_observations * 100),
-        'median_survival_time': float(median_survival) if median_survival else None,
-        'final_survival_probability': float(survival_function.iloc[-1].values[0]) if len(survival_function) > 0 else None
+        'total_observations': total_observations,
+        'events_count': events_count,
+        'censored_count': censored_count,
+        'event_rate': events_count / total_observations * 100,
+        'median_survival_time': median_survival,
+        'final_survival_probability': survival_function[-1] if len(survival_function) > 0 else None
     }
     
     return stats
@@ -95,44 +122,49 @@ def calculate_hazard_ratio(survival_df):
         survival_df: DataFrame with survival data
         
     Returns:
-        DataFrame with hazard ratios
+        numpy array: Hazard ratio per observation
     """
     # Simple hazard calculation: events per time period
-    hazard_df = survival_df.copy()
+    events = survival_df['event'].to_numpy()
+    n = events.shape[0]
     
     # Calculate cumulative hazard (approximation)
-    events_cumsum = hazard_df['event'].cumsum()
-    at_risk = len(hazard_df) - hazard_df.index
+    events_cumsum = np.cumsum(events)
+    at_risk = np.arange(n, 0, -1, dtype=np.int64)
     
     # Avoid division by zero
-    hazard_df['hazard_ratio'] = np.where(
-        at_risk > 0,
-        events_cumsum / at_risk,
-        0
+    hazard = np.divide(
+        events_cumsum, at_risk, out=np.zeros(n, dtype=np.float64), where=at_risk > 0
     )
     
-    return hazard_df
+    return hazard
 
 
-def create_survival_summary(survival_df, stats):
+def create_survival_summary(survival_df, hazard_ratio, stats):
     """
     Create summary DataFrame for output.
     
     Args:
-        survival_df: DataFrame with survival data and hazard ratios
+        survival_df: DataFrame with survival data
+        hazard_ratio: Hazard ratio array from calculate_hazard_ratio()
         stats: Survival statistics dict
         
     Returns:
         DataFrame: Summary for saving
     """
-    # Select relevant columns
-    output_cols = ['timestamp', 'duration', 'event', 'hazard_ratio']
+    # Build the output from only the columns we save (no full-frame copy)
+    summary_cols = {}
     
     # Add station_id if available
     if 'station_id' in survival_df.columns:
-        output_cols.insert(0, 'station_id')
+        summary_cols['station_id'] = survival_df['station_id'].array
     
-    summary_df = survival_df[output_cols].copy()
+    summary_cols['timestamp'] = survival_df['timestamp'].array
+    summary_cols['duration'] = survival_df['duration'].array
+    summary_cols['event'] = survival_df['event'].array
+    summary_cols['hazard_ratio'] = hazard_ratio
+    
+    summary_df = pd.DataFrame(summary_cols)
     
     return summary_df
 
@@ -151,6 +183,8 @@ def analyze_survival_by_group(survival_df, group_column=None):
     if group_column is None or group_column not in survival_df.columns:
         return None
     
+    from lifelines import KaplanMeierFitter
+    
     # Fit KM for each group
     groups = survival_df[group_column].unique()
     group_stats = {}
@@ -1,8 +1,8 @@
 import pandas as pd
+import pyarrow.parquet as pq
 from pathlib import Path
 from datetime import datetime
 import sys
-sys.path.append(str(Path(__file__).parent.parent))
 
 from .analyzer import (
     prepare_survival_data,
@@ -11,10 +11,18 @@ from .analyzer import (
     calculate_hazard_ratio,
     create_survival_summary
 )
-from ingest.logger import save_metadata, log_info
+from ..ingest.logger import save_metadata, log_info, PARQUET_WRITE_OPTIONS
 
+# Copy-on-write: derived frames share data until modified
+pd.options.mode.copy_on_write = True
 
-def perform_survival_analysis(predictions_path, output_dir, error_threshold=0.7):
+# Columns read from the evaluation results parquet file (station_id is optional)
+NEEDED_COLS = ['timestamp', 'abs_error', 'station_id']
+
+
+def perform_survival_analysis(
+    predictions_path, output_dir, error_threshold=0.7, run_ts=None, use_lifelines=False
+):
     """
     Perform survival analysis on model predictions.
     
@@ -22,53 +30,67 @@ def perform_survival_analysis(predictions_path, output_dir, error_threshold=0.7)
         predictions_path: Path to evaluation results parquet
         output_dir: Directory to save survival analysis
         error_threshold: Threshold for defining failure events
+        run_ts: Run timestamp for output naming and metadata (default: now)
+        use_lifelines: Fit the survival curve with lifelines instead of NumPy (cross-check)
         
     Returns:
         tuple: (success: bool, output_path: str or None)
     """
+    # Capture the run timestamp once for output paths and metadata
+    if run_ts is None:
+        run_ts = datetime.now()
+    
     log_info(f"Starting survival analysis")
     log_info(f"Predictions: {predictions_path}")
     log_info(f"Error threshold: {error_threshold}")
     
-    # Load predictions
-    predictions_df = pd.read_parquet(predictions_path)
+    # Load predictions, projecting to the needed columns present in the file
+    available_cols = set(pq.read_schema(predictions_path).names)
+    columns = [col for col in NEEDED_COLS if col in available_cols]
+    predictions_df = pd.read_parquet(predictions_path, engine='pyarrow', columns=columns)
     log_info(f"Loaded {len(predictions_df)} predictions")
     
     # Prepare survival data
     survival_df = prepare_survival_data(predictions_df, error_threshold)
     log_info(f"Prepared survival data with {survival_df['event'].sum()} events")
     
-    # Fit Kaplan-Meier survival curve
-    kmf = fit_kaplan_meier(survival_df)
-    log_info("Fitted Kaplan-Meier survival curve")
+    # Fit Kaplan-Meier survival curve with lifelines only when cross-checking
+    kmf = None
+    if use_lifelines:
+        kmf = fit_kaplan_meier(survival_df)
+        log_info("Fitted Kaplan-Meier survival curve with lifelines")
     
-    # Calculate survival statistics
-    stats = calculate_survival_statistics(kmf, survival_df)
+    # Calculate survival statistics (Kaplan-Meier estimated directly unless fitted above)
+    stats = calculate_survival_statistics(survival_df, kmf)
     log_info(f"Event rate: {stats['event_rate']:.2f}%")
     log_info(f"Events: {stats['events_count']}, Censored: {stats['censored_count']}")
     if stats['median_survival_time']:
         log_info(f"Median survival time: {stats['median_survival_time']:.2f}")
     
     # Calculate hazard ratios
-    survival_df = calculate_hazard_ratio(survival_df)
+    hazard_ratio = calculate_hazard_ratio(survival_df)
     log_info("Calculated hazard ratios")
     
     # Create summary
-    summary_df = create_survival_summary(survival_df, stats)
+    summary_df = create_survival_summary(survival_df, hazard_ratio, stats)
     
     # Create output directory
     output_path = Path(output_dir)
     output_path.mkdir(parents=True, exist_ok=True)
     
     # Save survival analysis with date
-    date_str = datetime.now().strftime('%Y%m%d')
+    date_str = run_ts.strftime('%Y%m%d')
     analysis_path = output_path / f'survival_analysis_{date_str}.parquet'
-    summary_df.to_parquet(analysis_path, index=False)
+    # Shared options with a faster zstd level and full-size row groups, as in ingest
+    summary_df.to_parquet(
+        analysis_path,
+        **{**PARQUET_WRITE_OPTIONS, 'compression_level': 1, 'row_group_size': 131072}
+    )
     log_info(f"Saved survival analysis to {analysis_path}")
     
     # Create and save metadata
     metadata = {
-        'analysis_date': datetime.now().isoformat(),
+        'analysis_date': run_ts.isoformat(),
         'total_observations': stats['total_observations'],
         'events_count': stats['events_count'],
         'censored_count': stats['censored_count'],
@@ -92,7 +114,12 @@ if __name__ == "__main__":
     output_dir = "data/processed"
     
     # Use 90th percentile threshold (about 0.7 based on previous analysis)
-    success, path = perform_survival_analysis(predictions_file, output_dir, error_threshold=0.7)
+    success, path = perform_survival_analysis(
+        predictions_file,
+        output_dir,
+        error_threshold=0.7,
+        use_lifelines='--use-lifelines' in sys.argv
+    )
     if success:
         print(f"✅ Success! Survival analysis saved to: {path}")
     else:
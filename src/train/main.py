@@ -1,14 +1,14 @@
 import pandas as pd
 from pathlib import Path
 from datetime import datetime
-import sys
-sys.path.append(str(Path(__file__).parent.parent))
 
 from .trainer import prepare_data, train_model, evaluate_model, save_model
-from ingest.logger import save_metadata, log_info
+from ..ingest.logger import save_metadata, log_info
 
 
-def train_weather_model(input_path, output_dir, target='temperature', model_type='RandomForest'):
+def train_weather_model(
+    input_path, output_dir, target='temperature', model_type='HistGBR', run_ts=None
+):
     """
     Train a weather prediction model.
     
@@ -16,17 +16,26 @@ def train_weather_model(input_path, output_dir, target='temperature', model_type
         input_path: Path to featured parquet file
         output_dir: Directory to save model
         target: Target variable to predict
-        model_type: Type of model to train
+        model_type: Type of model to train ('HistGBR' or 'RandomForest')
+        run_ts: Run timestamp for output naming and metadata (default: now)
         
     Returns:
         tuple: (success: bool, model_path: str or None)
     """
+    # Capture the run timestamp once for output paths and metadata
+    if run_ts is None:
+        run_ts = datetime.now()
+    
     log_info(f"Starting model training from {input_path}")
     
-    # Read featured parquet file
-    df = pd.read_parquet(input_path)
+    # Read featured parquet file (nullable dtypes, no object upcast for missing values)
+    df = pd.read_parquet(input_path, engine='pyarrow', dtype_backend='numpy_nullable')
     log_info(f"Read {len(df)} rows from featured data")
     
+    # Downcast double-precision columns before the split, training runs in float32
+    float64_cols = df.select_dtypes(include=['float64', 'Float64']).columns
+    df = df.astype(dict.fromkeys(float64_cols, 'Float32'))
+    
     # Prepare data for training
     X_train, X_val, y_train, y_val, feature_cols = prepare_data(
         df, target_column=target, test_size=0.2
@@ -34,15 +43,11 @@ def train_weather_model(input_path, output_dir, target='temperature', model_type
     log_info(f"Train samples: {len(X_train)}, Validation samples: {len(X_val)}")
     log_info(f"Using {len(feature_cols)} features: {', '.join(feature_cols)}")
     
-    # Train model
-    hyperparameters = {
-        'n_estimators': 100,
-        'max_depth': 10,
-        'random_state': 42
-    }
-    log_info(f"Training {model_type} model with params: {hyperparameters}")
-    model = train_model(X_train, y_train, model_type=model_type, **hyperparameters)
-    log_info("Model training complete")
+    # Train model with the trainer's defaults, then record the parameters actually used
+    log_info(f"Training {model_type} model")
+    model = train_model(X_train, y_train, model_type=model_type)
+    hyperparameters = model.get_params()
+    log_info(f"Model training complete with params: {hyperparameters}")
     
     # Evaluate model
     metrics = evaluate_model(model, X_val, y_val)
@@ -53,14 +58,14 @@ def train_weather_model(input_path, output_dir, target='temperature', model_type
     output_path.mkdir(parents=True, exist_ok=True)
     
     # Save model with date
-    date_str = datetime.now().strftime('%Y%m%d')
+    date_str = run_ts.strftime('%Y%m%d')
     model_path = output_path / f'model_{date_str}.pkl'
     save_model(model, model_path)
     log_info(f"Saved model to {model_path}")
     
     # Create and save metadata
     metadata = {
-        'training_date': datetime.now().isoformat(),
+        'training_date': run_ts.isoformat(),
         'model_type': model_type,
         'target_column': target,
         'feature_columns': feature_cols,
@@ -1,11 +1,12 @@
 import pandas as pd
 import numpy as np
 from sklearn.model_selection import train_test_split
-from sklearn.ensemble import RandomForestRegressor
-from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
+from sklearn.ensemble import HistGradientBoostingRegressor, RandomForestRegressor
 import joblib
 from pathlib import Path
 
+from ..evaluate.evaluator import regression_metrics
+
 
 def prepare_data(df, target_column='temperature', test_size=0.2, random_state=42):
     """
@@ -18,15 +19,15 @@ def prepare_data(df, target_column='temperature', test_size=0.2, random_state=42
         random_state: Random seed for reproducibility
         
     Returns:
-        tuple: (X_train, X_val, y_train, y_val, feature_columns)
+        tuple: (X_train, X_val, y_train, y_val as float32 numpy arrays, feature_columns)
     """
-    # Drop columns that shouldn't be features
+    # Drop columns that shouldn't be features (keeps the file's column order)
     exclude_cols = ['timestamp', 'station_id', target_column]
-    feature_cols = [col for col in df.columns if col not in exclude_cols]
+    feature_cols = df.columns.drop(exclude_cols, errors='ignore').tolist()
     
-    # Prepare features and target
-    X = df[feature_cols]
-    y = df[target_column]
+    # Prepare features and target as plain arrays so the split does not copy frames
+    X = df[feature_cols].to_numpy(dtype=np.float32, na_value=np.nan)
+    y = df[target_column].to_numpy(dtype=np.float32, na_value=np.nan)
     
     # Split into train and validation sets
     X_train, X_val, y_train, y_val = train_test_split(
@@ -43,17 +44,38 @@ def train_model(X_train, y_train, model_type='RandomForest', **hyperparameters):
     Args:
         X_train: Training features
         y_train: Training target
-        model_type: Type of model to train
+        model_type: Type of model to train ('HistGBR' or 'RandomForest')
         **hyperparameters: Model hyperparameters
         
     Returns:
         trained model
     """
-    if model_type == 'RandomForest':
+    # Train in float32; both model types work in float32 internally anyway
+    X_train = X_train.astype(np.float32, copy=False)
+    
+    if model_type == 'HistGBR':
+        # Set default hyperparameters if not provided
+        default_params = {
+            'max_iter': 200,
+            'max_depth': 8,
+            'learning_rate': 0.1,
+            'early_stopping': True,
+            'random_state': 42
+        }
+        # Update with provided hyperparameters
+        default_params.update(hyperparameters)
+        
+        model = HistGradientBoostingRegressor(**default_params)
+    elif model_type == 'RandomForest':
         # Set default hyperparameters if not provided
         default_params = {
             'n_estimators': 100,
             'max_depth': 10,
+            'min_samples_leaf': 5,
+            # Bag 60% of rows per tree and consider sqrt(p) features per split
+            'bootstrap': True,
+            'max_samples': 0.6,
+            'max_features': 'sqrt',
             'random_state': 42,
             'n_jobs': -1
         }
@@ -85,30 +107,23 @@ def evaluate_model(model, X_val, y_val):
     # Make predictions
     y_pred = model.predict(X_val)
     
-    # Calculate metrics
-    mae = mean_absolute_error(y_val, y_pred)
-    rmse = np.sqrt(mean_squared_error(y_val, y_pred))
-    r2 = r2_score(y_val, y_pred)
-    
-    metrics = {
-        'mae': float(mae),
-        'rmse': float(rmse),
-        'r2_score': float(r2)
-    }
+    # Calculate metrics (shared with the evaluation stage)
+    metrics = regression_metrics(y_val, y_pred)
     
     return metrics
 
 
-def save_model(model, output_path):
+def save_model(model, output_path, compress=3):
     """
     Save trained model to disk.
     
     Args:
         model: Trained model
         output_path: Path to save model file
+        compress: joblib (zlib) compression level, 0 to allow memory-mapped loading
     """
     output_path = Path(output_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
     
-    # Save model using joblib
-    joblib.dump(model, output_path)
+    # Save model using joblib, compressed and with pickle protocol 5 buffers
+    joblib.dump(model, output_path, compress=compress, protocol=5)
@@ -2,11 +2,18 @@
 Pytest configuration and shared fixtures for Weather Predict Model tests.
 """
 import pytest
+import numpy as np
 import pandas as pd
 import yaml
 from pathlib import Path
 from datetime import datetime
 
+# Use the LibYAML C parser when available
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
 
 @pytest.fixture
 def project_root():
@@ -38,23 +45,22 @@ def load_schema(schemas_dir):
     def _load_schema(schema_name):
         schema_path = schemas_dir / f"{schema_name}.yaml"
         with open(schema_path, 'r') as f:
-            return yaml.safe_load(f)
+            return yaml.load(f, Loader=_Loader)
     return _load_schema
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def sample_weather_data():
-    """Create sample weather data for testing."""
+    """Create sample weather data for testing (shared; tests that mutate it must .copy())."""
+    # Temperature peaks (and humidity bottoms out) at hour 15
+    hours_from_peak = np.abs(np.arange(24) - 15.0)
+    
     return pd.DataFrame({
-        'timestamp': pd.date_range('2025-01-01', periods=24, freq='H'),
+        'timestamp': pd.date_range('2025-01-01', periods=24, freq='h'),
         'station_id': ['STATION_001'] * 24,
-        'temperature': [15.5, 16.0, 16.5, 17.0, 17.5, 18.0, 18.5, 19.0,
-                       19.5, 20.0, 20.5, 21.0, 21.5, 22.0, 22.5, 23.0,
-                       22.5, 22.0, 21.5, 21.0, 20.5, 20.0, 19.5, 19.0],
-        'humidity': [65.0, 64.0, 63.0, 62.0, 61.0, 60.0, 59.0, 58.0,
-                    57.0, 56.0, 55.0, 54.0, 53.0, 52.0, 51.0, 50.0,
-                    51.0, 52.0, 53.0, 54.0, 55.0, 56.0, 57.0, 58.0],
-        'pressure': [1013.25] * 24
+        'temperature': 23.0 - 0.5 * hours_from_peak,
+        'humidity': 50.0 + hours_from_peak,
+        'pressure': np.full(24, 1013.25)
     })
 
 
@@ -0,0 +1,31 @@
+"""
+Tests for the feature engineering helpers.
+"""
+import numpy as np
+import pandas as pd
+
+from src.features.feature_engineering import add_rolling_features
+
+
+def test_rolling_features_match_pandas(sample_weather_data):
+    """Rolling mean/std follow pandas rolling, the leading std is filled with 0."""
+    featured = add_rolling_features(sample_weather_data, window=24)
+    rolling = sample_weather_data['temperature'].rolling(24, min_periods=1)
+
+    np.testing.assert_allclose(featured['temp_rolling_mean_24h'], rolling.mean())
+    np.testing.assert_allclose(featured['temp_rolling_std_24h'], rolling.std().fillna(0))
+    assert featured['temp_rolling_std_24h'].iloc[0] == 0.0
+
+
+def test_rolling_features_missing_and_flat_values():
+    """Missing temperatures are skipped and windows of equal values have zero std."""
+    temperature = np.concatenate([np.linspace(10.0, 20.0, 30), np.full(30, 0.1)])
+    temperature[[3, 4, 40]] = np.nan
+    df = pd.DataFrame({'temperature': pd.array(temperature, dtype='double[pyarrow]')})
+
+    featured = add_rolling_features(df, window=24)
+    rolling = pd.Series(temperature).rolling(24, min_periods=1)
+
+    np.testing.assert_allclose(featured['temp_rolling_mean_24h'], rolling.mean())
+    np.testing.assert_allclose(featured['temp_rolling_std_24h'], rolling.std().fillna(0))
+    assert (featured['temp_rolling_std_24h'].iloc[-5:] == 0.0).all()
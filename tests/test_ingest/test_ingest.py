@@ -0,0 +1,87 @@
+"""
+Tests for CSV ingestion.
+"""
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+from datetime import datetime
+
+from src.ingest.main import ROW_GROUP_SIZE, _timestamp_type, ingest_data
+
+RUN_TS = datetime(2026, 1, 3, 12)
+HEADER = 'timestamp,station_id,temperature,humidity,pressure\n'
+
+
+def _write_csv(path, timestamps, humidity=None):
+    """Write a weather CSV with one row per timestamp."""
+    with open(path, 'w') as f:
+        f.write(HEADER)
+        for i, ts in enumerate(timestamps):
+            value = humidity(i) if humidity else 55
+            f.write(f'{ts},STATION_001,{i % 40 - 10}.5,{value},1013.25\n')
+    return path
+
+
+@pytest.mark.parametrize('value, expected', [
+    ('2025-01-01T00:00:00+0200', pa.timestamp('ns', tz='+02:00')),
+    ('2025-01-01 00:00:00-05:30', pa.timestamp('ns', tz='-05:30')),
+    ('2025-01-01T00:00:00Z', pa.timestamp('ns', tz='UTC')),
+    ('2025-01-01 00:00:00', pa.timestamp('ns')),
+    ('2025-01-01', pa.timestamp('ns')),
+])
+def test_timestamp_type_from_first_value(tmp_path, value, expected):
+    """Offsets after the date part pick a fixed-offset zone, Z picks UTC, others stay naive."""
+    source = _write_csv(tmp_path / 'weather.csv', [value])
+
+    assert _timestamp_type(source) == expected
+
+
+@pytest.mark.parametrize('timestamps, tz', [
+    (['2025-01-01T00:00:00+02:00', '2025-01-01T01:00:00+02:00'], '+02:00'),
+    (['2025-01-01 00:00:00', '2025-01-01 01:00:00'], None),
+    (['2025-01-01', '2025-01-02'], None),
+])
+def test_ingest_timestamps(tmp_path, timestamps, tz):
+    """Offset, naive and date-only timestamps are all parsed to nanosecond timestamps."""
+    source = _write_csv(tmp_path / 'weather.csv', timestamps)
+
+    success, output_path = ingest_data(source, tmp_path, 'STATION_001', run_ts=RUN_TS)
+    table = pq.read_table(output_path)
+
+    assert success
+    assert table.schema.field('timestamp').type == pa.timestamp('ns', tz=tz)
+    assert table.num_rows == len(timestamps)
+
+
+def test_ingest_row_groups_and_types(tmp_path):
+    """Batches are carried into full row groups; integer-looking early values stay float."""
+    n = 300000
+    timestamps = (f'2025-01-01 {i % 24:02d}:00:00' for i in range(n))
+    source = _write_csv(
+        tmp_path / 'weather.csv', timestamps, humidity=lambda i: 55 if i < 1000 else 18.3
+    )
+
+    success, output_path = ingest_data(source, tmp_path, 'STATION_001', run_ts=RUN_TS)
+    metadata = pq.read_metadata(output_path)
+
+    assert success
+    assert metadata.num_rows == n
+    row_groups = [metadata.row_group(i).num_rows for i in range(metadata.num_row_groups)]
+    assert row_groups == [ROW_GROUP_SIZE, ROW_GROUP_SIZE, n - 2 * ROW_GROUP_SIZE]
+    assert pq.read_schema(output_path).field('humidity').type == pa.float64()
+
+
+def test_ingest_failure_leaves_no_output(tmp_path):
+    """A value that fails to parse late in the file leaves neither output nor temporary file."""
+    n = 200000
+    timestamps = (f'2025-01-01 {i % 24:02d}:00:00' for i in range(n))
+    source = _write_csv(
+        tmp_path / 'weather.csv', timestamps, humidity=lambda i: 'n/a!' if i == n - 1 else 55
+    )
+    output_dir = tmp_path / 'out'
+    output_dir.mkdir()
+
+    with pytest.raises(pa.ArrowInvalid):
+        ingest_data(source, output_dir, 'STATION_001', run_ts=RUN_TS)
+
+    assert list(output_dir.iterdir()) == []